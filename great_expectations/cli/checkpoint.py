@@ -109,8 +109,10 @@
 --ge-feature-maturity-info--
 """
 
+import copy
 import os
 import sys
+from functools import lru_cache
 from typing import Dict
 
 import click
@@ -192,7 +194,7 @@ def checkpoint_new(checkpoint, suite, directory, datasource):
     template["batches"][0]["batch_kwargs"] = dict(batch_kwargs)
     template["batches"][0]["expectation_suite_names"] = [suite.expectation_suite_name]
 
-    checkpoint_file = _write_checkpoint_to_disk(context, template, checkpoint)
+    checkpoint_file = context.add_checkpoint(checkpoint, template)
     cli_message(
         f"""<green>A checkpoint named `{checkpoint}` was added to your project!</green>
   - To edit this checkpoint edit the checkpoint file: {checkpoint_file}
@@ -204,7 +206,7 @@ def checkpoint_new(checkpoint, suite, directory, datasource):
 def _verify_checkpoint_does_not_exist(
     context: DataContext, checkpoint: str, usage_event: str
 ) -> None:
-    if checkpoint in context.list_checkpoints():
+    if context.has_checkpoint(checkpoint):
         toolkit.exit_with_failure_message_and_stats(
             context,
             usage_event,
@@ -212,22 +214,13 @@ def _verify_checkpoint_does_not_exist(
         )
 
 
-def _write_checkpoint_to_disk(
-    context: DataContext, checkpoint: Dict, checkpoint_name: str
-) -> str:
-    # TODO this should be the responsibility of the DataContext
-    checkpoint_dir = os.path.join(
-        context.root_directory,
-        context.CHECKPOINTS_DIR,
-    )
-    checkpoint_file = os.path.join(checkpoint_dir, f"{checkpoint_name}.yml")
-    os.makedirs(checkpoint_dir, exist_ok=True)
-    with open(checkpoint_file, "w") as f:
-        yaml.dump(checkpoint, f)
-    return checkpoint_file
+def _load_checkpoint_yml_template() -> dict:
+    # Callers fill in the template, so hand out a copy of the parsed original
+    return copy.deepcopy(_parse_checkpoint_yml_template())
 
 
-def _load_checkpoint_yml_template() -> dict:
+@lru_cache(maxsize=1)
+def _parse_checkpoint_yml_template() -> dict:
     # TODO this should be the responsibility of the DataContext
     template_file = file_relative_path(
         __file__, os.path.join("..", "data_context", "checkpoint_template.yml")
@@ -8,6 +8,10 @@ class DataContextKey(metaclass=ABCMeta):
     version making it suitable for use as the key in a dictionary.
     """
 
+    # Keys are created in large numbers (e.g. one per stored object when listing a store), so subclasses
+    # declare __slots__ to avoid a per-instance __dict__.
+    __slots__ = ()
+
     @abstractmethod
     def to_tuple(self):
         pass
@@ -42,6 +46,8 @@ class DataContextKey(metaclass=ABCMeta):
 class StringKey(DataContextKey):
     """A simple DataContextKey with just a single string value"""
 
+    __slots__ = ("_key",)
+
     def __init__(self, key):
         self._key = key
 
@@ -40,6 +40,8 @@ class Metric:
 class MetricIdentifier(DataContextKey):
     """A MetricIdentifier serves as a key to store and retrieve Metrics."""
 
+    __slots__ = ("_metric_name", "_metric_kwargs_id")
+
     def __init__(self, metric_name, metric_kwargs_id):
         self._metric_name = metric_name
         self._metric_kwargs_id = metric_kwargs_id
@@ -147,6 +149,8 @@ class ValidationMetric(Metric):
 
 
 class ValidationMetricIdentifier(MetricIdentifier):
+    __slots__ = ("_run_id", "_data_asset_name", "_expectation_suite_identifier")
+
     def __init__(
         self,
         run_id,
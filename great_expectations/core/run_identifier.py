@@ -11,6 +11,8 @@ from great_expectations.marshmallow__shade import Schema, fields, post_load
 class RunIdentifier(DataContextKey):
     """A RunIdentifier identifies a run (collection of validations) by run_name and run_time."""
 
+    __slots__ = ("_run_name", "_run_time")
+
     def __init__(self, run_name=None, run_time=None):
         super().__init__()
         assert run_name is None or isinstance(
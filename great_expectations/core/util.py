@@ -45,6 +45,19 @@ def nested_update(d, u):
     return d
 
 
+def copy_plain_data(data):
+    """Copy nested dicts and lists, such as data loaded from YAML or JSON.
+
+    Unlike copy.deepcopy, no memo of visited objects is kept, so this is only suitable for
+    acyclic data whose leaves (strings, numbers, dates, None) are immutable.
+    """
+    if isinstance(data, dict):
+        return {key: copy_plain_data(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [copy_plain_data(value) for value in data]
+    return data
+
+
 def in_jupyter_notebook():
     try:
         shell = get_ipython().__class__.__name__
@@ -12,7 +12,7 @@ import traceback
 import uuid
 import warnings
 import webbrowser
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 from dateutil.parser import parse
@@ -34,7 +34,7 @@ from great_expectations.core.usage_statistics.usage_statistics import (  # TODO:
     save_expectation_suite_usage_statistics,
     usage_statistics_enabled_method,
 )
-from great_expectations.core.util import nested_update
+from great_expectations.core.util import copy_plain_data, nested_update
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_context.store import TupleStoreBackend
 from great_expectations.data_context.templates import (
@@ -284,6 +284,9 @@ class BaseDataContext:
         # Store cached datasources but don't init them
         self._cached_datasources = {}
 
+        # Store parsed checkpoints along with the file contents they were parsed from
+        self._cached_checkpoints = {}
+
         # Init validation operators
         # NOTE - 20200522 - JPC - A consistent approach to lazy loading for plugins will be useful here, harmonizing
         # the way that execution environments (AKA datasources), validation operators, site builders and other
@@ -1862,28 +1865,96 @@ class BaseDataContext:
         Returns:
             A new (empty) expectation suite.
         """
+        (key,) = self._get_expectation_suite_keys_to_create(
+            [expectation_suite_name], overwrite_existing
+        )
+        expectation_suite = ExpectationSuite(
+            expectation_suite_name=expectation_suite_name
+        )
+        self._stores[self.expectations_store_name].set(key, expectation_suite)
+
+        return expectation_suite
+
+    def create_expectation_suites(
+        self, expectation_suite_names: List[str], overwrite_existing=False
+    ) -> List[ExpectationSuite]:
+        """Build several new expectation suites and save them into the data_context expectation store.
+
+        Every name is checked against the store before any suite is saved, so an existing name (with
+        overwrite_existing=False) raises before anything is written.
+
+        Args:
+            expectation_suite_names: The names of the expectation_suites to create
+            overwrite_existing (boolean): Whether to overwrite expectation suites whose names already exist.
+
+        Returns:
+            A list of new (empty) expectation suites, in the order of expectation_suite_names.
+        """
+        if isinstance(expectation_suite_names, str):
+            raise ValueError(
+                "Parameter expectation_suite_names must be a list of names, not a single string"
+            )
+
+        keys = self._get_expectation_suite_keys_to_create(
+            expectation_suite_names, overwrite_existing
+        )
+        expectation_suites = []
+        for key in keys:
+            expectation_suite = ExpectationSuite(
+                expectation_suite_name=key.expectation_suite_name
+            )
+            self._stores[self.expectations_store_name].set(key, expectation_suite)
+            expectation_suites.append(expectation_suite)
+
+        return expectation_suites
+
+    def _get_expectation_suite_keys_to_create(
+        self, expectation_suite_names: List[str], overwrite_existing: bool
+    ) -> List[ExpectationSuiteIdentifier]:
+        """Build the store keys for new expectation suites, raising if any name is repeated or already exists."""
         if not isinstance(overwrite_existing, bool):
             raise ValueError("Parameter overwrite_existing must be of type BOOL")
 
-        expectation_suite = ExpectationSuite(
-            expectation_suite_name=expectation_suite_name
+        duplicate_names = sorted(
+            expectation_suite_name
+            for expectation_suite_name, count in Counter(
+                expectation_suite_names
+            ).items()
+            if count > 1
         )
-        key = ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
+        if duplicate_names:
+            raise ge_exceptions.DataContextError(
+                "expectation_suites with names {} are requested more than once. Each expectation_suite "
+                "can only be created once per call.".format(duplicate_names)
+            )
 
-        if (
-            self._stores[self.expectations_store_name].has_key(key)
-            and not overwrite_existing
-        ):
+        keys = [
+            ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
+            for expectation_suite_name in expectation_suite_names
+        ]
+        if overwrite_existing:
+            return keys
+
+        existing_names = [
+            key.expectation_suite_name
+            for key in keys
+            if self._stores[self.expectations_store_name].has_key(key)
+        ]
+        if len(existing_names) == 1:
             raise ge_exceptions.DataContextError(
                 "expectation_suite with name {} already exists. If you would like to overwrite this "
                 "expectation_suite, set overwrite_existing=True.".format(
-                    expectation_suite_name
+                    existing_names[0]
                 )
             )
-        else:
-            self._stores[self.expectations_store_name].set(key, expectation_suite)
-
-        return expectation_suite
+        elif existing_names:
+            raise ge_exceptions.DataContextError(
+                "expectation_suites with names {} already exist. If you would like to overwrite these "
+                "expectation_suites, set overwrite_existing=True.".format(
+                    existing_names
+                )
+            )
+        return keys
 
     def delete_expectation_suite(self, expectation_suite_name):
         """Delete specified expectation suite from data_context expectation store.
@@ -2748,8 +2819,21 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
             if os.path.basename(f).endswith(".yml")
         ]
 
+    def has_checkpoint(self, checkpoint_name: str) -> bool:
+        """Check whether a checkpoint exists, without listing all checkpoints. (Experimental)"""
+        return os.path.isfile(
+            os.path.join(
+                self.root_directory, self.CHECKPOINTS_DIR, f"{checkpoint_name}.yml"
+            )
+        )
+
     def get_checkpoint(self, checkpoint_name: str) -> dict:
-        """Load a checkpoint. (Experimental)"""
+        """Load a checkpoint. (Experimental)
+
+        Returns:
+            The validated checkpoint as a new plain dict (nested values are plain dicts and lists), which callers
+            may modify freely
+        """
         # TODO mark experimental
         yaml = YAML(typ="safe")
         # TODO make a serializable class with a schema
@@ -2758,12 +2842,57 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
         )
         try:
             with open(checkpoint_path) as f:
-                checkpoint = yaml.load(f.read())
-                return self._validate_checkpoint(checkpoint, checkpoint_name)
+                checkpoint_yml = f.read()
         except FileNotFoundError:
+            self._cached_checkpoints.pop(checkpoint_name, None)
             raise ge_exceptions.CheckpointNotFoundError(
                 f"Could not find checkpoint `{checkpoint_name}`."
             )
+        # Reading the file is cheap; only parsing and validating it is skipped
+        # when its contents are unchanged.
+        cached = self._cached_checkpoints.get(checkpoint_name)
+        if cached is None or cached[0] != checkpoint_yml:
+            checkpoint = yaml.load(checkpoint_yml)
+            checkpoint = self._validate_checkpoint(checkpoint, checkpoint_name)
+            cached = (checkpoint_yml, checkpoint)
+            self._cached_checkpoints[checkpoint_name] = cached
+        # Callers (e.g. run_checkpoint) are free to mutate what they get back
+        return copy_plain_data(cached[1])
+
+    def add_checkpoint(
+        self, checkpoint_name: str, checkpoint: dict, overwrite_existing=False
+    ) -> str:
+        """Save a checkpoint to the checkpoints directory. (Experimental)
+
+        Args:
+            checkpoint_name: The name of the checkpoint; it is saved as `<checkpoint_name>.yml`
+            checkpoint: The checkpoint config, e.g. as returned by get_checkpoint; it is not modified
+            overwrite_existing (boolean): Whether to overwrite the checkpoint if a checkpoint with the given name
+                already exists.
+
+        Returns:
+            The path of the saved checkpoint file
+        """
+        if not isinstance(overwrite_existing, bool):
+            raise ValueError("Parameter overwrite_existing must be of type BOOL")
+
+        if self.has_checkpoint(checkpoint_name) and not overwrite_existing:
+            raise ge_exceptions.DataContextError(
+                "checkpoint with name {} already exists. If you would like to overwrite this "
+                "checkpoint, set overwrite_existing=True.".format(checkpoint_name)
+            )
+
+        # deepcopy rather than copy_plain_data: it keeps the comments of CommentedMap templates
+        checkpoint = self._validate_checkpoint(
+            copy.deepcopy(checkpoint), checkpoint_name
+        )
+        checkpoints_dir = os.path.join(self.root_directory, self.CHECKPOINTS_DIR)
+        checkpoint_path = os.path.join(checkpoints_dir, f"{checkpoint_name}.yml")
+        os.makedirs(checkpoints_dir, exist_ok=True)
+        with open(checkpoint_path, "w") as f:
+            yaml.dump(checkpoint, f)
+        self._cached_checkpoints.pop(checkpoint_name, None)
+        return checkpoint_path
 
     def run_checkpoint(
         self,
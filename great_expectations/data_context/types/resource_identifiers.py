@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 
 
 class ExpectationSuiteIdentifier(DataContextKey):
+    __slots__ = ("_expectation_suite_name",)
+
     def __init__(self, expectation_suite_name: str):
         super().__init__()
         if not isinstance(expectation_suite_name, str):
@@ -56,6 +58,8 @@ class ExpectationSuiteIdentifierSchema(Schema):
 class BatchIdentifier(DataContextKey):
     """A BatchIdentifier tracks """
 
+    __slots__ = ("_batch_identifier", "_data_asset_name")
+
     def __init__(
         self,
         batch_identifier: Union[BatchKwargs, dict, str],
@@ -99,6 +103,8 @@ class ValidationResultIdentifier(DataContextKey):
     and run_id.
     """
 
+    __slots__ = ("_expectation_suite_identifier", "_run_id", "_batch_identifier")
+
     def __init__(self, expectation_suite_identifier, run_id, batch_identifier):
         """Constructs a ValidationResultIdentifier
 
@@ -217,6 +223,8 @@ class ValidationResultIdentifierSchema(Schema):
 
 
 class SiteSectionIdentifier(DataContextKey):
+    __slots__ = ("_site_section_name", "_resource_identifier")
+
     def __init__(self, site_section_name, resource_identifier):
         self._site_section_name = site_section_name
         if site_section_name in ["validations", "profiling"]:
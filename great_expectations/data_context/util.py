@@ -24,6 +24,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Matches non-escaped ${SOME_VARIABLE} or $SOME_VARIABLE patterns
+CONFIG_VARIABLE_PATTERN = re.compile(
+    r"(?<!\\)\$\{(.*?)\}|(?<!\\)\$([_a-zA-Z][_a-zA-Z0-9]*)"
+)
+
 
 # TODO: Rename config to constructor_kwargs and config_defaults -> constructor_kwarg_default
 # TODO: Improve error messages in this method. Since so much of our workflow is config-driven, this will be a *super* important part of DX.
@@ -142,11 +147,17 @@ def substitute_config_variable(
     if template_str is None:
         return template_str
 
+    # Most config values are plain strings; skip the regex when there is nothing to substitute or un-escape
+    if (
+        isinstance(template_str, str)
+        and "$" not in template_str
+        and dollar_sign_escape_string not in template_str
+    ):
+        return template_str
+
     # 1. Make substitutions for non-escaped patterns
     try:
-        match = re.finditer(
-            r"(?<!\\)\$\{(.*?)\}|(?<!\\)\$([_a-zA-Z][_a-zA-Z0-9]*)", template_str
-        )
+        match = CONFIG_VARIABLE_PATTERN.finditer(template_str)
     except TypeError:
         # If the value is not a string (e.g., a boolean), we should return it as is
         return template_str
@@ -1589,11 +1589,16 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
+        # Check the schema and build its validator once, rather than once per row
+        validator_class = jsonschema.validators.validator_for(json_schema)
+        validator_class.check_schema(json_schema)
+        json_schema_validator = validator_class(json_schema)
+
         def matches_json_schema(val):
             try:
                 val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
+                json_schema_validator.validate(val_json)
+                # validate raises an error if validation fails.
                 # So if we make it this far, we know that the validation succeeded.
                 return True
             except jsonschema.ValidationError:
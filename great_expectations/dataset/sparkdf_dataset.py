@@ -1115,11 +1115,18 @@ class SparkDFDataset(MetaSparkDFDataset):
         catch_exceptions=None,
         meta=None,
     ):
+        # Check the schema once on the driver; per-row validators then skip the meta-schema check.
+        # The UDF closure captures only json_schema: on jsonschema 3.x the validator classes are local
+        # classes that do not survive pickling to the executors.
+        jsonschema.validators.validator_for(json_schema).check_schema(json_schema)
+
         def matches_json_schema(val):
             try:
                 val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
+                jsonschema.validators.validator_for(json_schema)(json_schema).validate(
+                    val_json
+                )
+                # validate raises an error if validation fails.
                 # So if we make it this far, we know that the validation succeeded.
                 return True
             except jsonschema.ValidationError:
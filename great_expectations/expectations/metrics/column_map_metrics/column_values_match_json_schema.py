@@ -19,11 +19,16 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
+        # Check the schema and build its validator once, rather than once per row
+        validator_class = jsonschema.validators.validator_for(json_schema)
+        validator_class.check_schema(json_schema)
+        json_schema_validator = validator_class(json_schema)
+
         def matches_json_schema(val):
             try:
                 val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
+                json_schema_validator.validate(val_json)
+                # validate raises an error if validation fails.
                 # So if we make it this far, we know that the validation succeeded.
                 return True
             except jsonschema.ValidationError:
@@ -37,13 +42,20 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
+        # Check the schema once on the driver; per-row validators then skip the meta-schema check.
+        # The UDF closure captures only json_schema: on jsonschema 3.x the validator classes are local
+        # classes that do not survive pickling to the executors.
+        jsonschema.validators.validator_for(json_schema).check_schema(json_schema)
+
         def matches_json_schema(val):
             if val is None:
                 return False
             try:
                 val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
+                jsonschema.validators.validator_for(json_schema)(json_schema).validate(
+                    val_json
+                )
+                # validate raises an error if validation fails.
                 # So if we make it this far, we know that the validation succeeded.
                 return True
             except jsonschema.ValidationError:
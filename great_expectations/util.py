@@ -5,7 +5,7 @@ import logging
 import os
 import time
 from collections import OrderedDict
-from functools import wraps
+from functools import lru_cache, wraps
 from gc import get_referrers
 from inspect import (
     ArgInfo,
@@ -140,6 +140,8 @@ def get_currently_executing_function_call_arguments(
     return call_args_dict
 
 
+# Only successful lookups are cached (a raised error is not), so a module that appears later is still found.
+@lru_cache(maxsize=None)
 def verify_dynamic_loading_support(module_name: str, package_name: str = None) -> None:
     """
     :param module_name: a possibly-relative name of a module
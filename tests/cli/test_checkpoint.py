@@ -37,15 +37,9 @@ def titanic_checkpoint(titanic_data_context_stats_enabled, titanic_expectation_s
 def titanic_data_context_with_checkpoint_suite_and_stats_enabled(
     titanic_data_context_stats_enabled, titanic_checkpoint, titanic_expectation_suite
 ):
-    yaml = YAML()
     context = titanic_data_context_stats_enabled
     context.save_expectation_suite(titanic_expectation_suite)
-    # TODO context should save a checkpoint
-    checkpoint_path = os.path.join(
-        context.root_directory, context.CHECKPOINTS_DIR, "my_checkpoint.yml"
-    )
-    with open(checkpoint_path, "w") as f:
-        yaml.dump(titanic_checkpoint, f)
+    checkpoint_path = context.add_checkpoint("my_checkpoint", titanic_checkpoint)
     assert os.path.isfile(checkpoint_path)
     assert context.list_expectation_suite_names() == ["Titanic.warning"]
     assert context.list_checkpoints() == ["my_checkpoint"]
@@ -0,0 +1,54 @@
+import datetime
+from collections import OrderedDict
+
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
+from great_expectations.core.util import copy_plain_data
+
+
+def test_copy_plain_data_isolates_nested_dicts_and_lists():
+    data = {
+        "validation_operator_name": "action_list_operator",
+        "batches": [
+            {"batch_kwargs": {"path": "foo.csv"}, "expectation_suite_names": ["a"]}
+        ],
+    }
+    copied = copy_plain_data(data)
+    assert copied == data
+    assert copied is not data
+    assert copied["batches"] is not data["batches"]
+    assert copied["batches"][0] is not data["batches"][0]
+    assert (
+        copied["batches"][0]["batch_kwargs"] is not data["batches"][0]["batch_kwargs"]
+    )
+
+    copied["batches"][0]["batch_kwargs"]["path"] = "bar.csv"
+    copied["batches"][0]["expectation_suite_names"].append("b")
+    copied["batches"].append({})
+    assert data == {
+        "validation_operator_name": "action_list_operator",
+        "batches": [
+            {"batch_kwargs": {"path": "foo.csv"}, "expectation_suite_names": ["a"]}
+        ],
+    }
+
+
+def test_copy_plain_data_returns_leaves_unchanged():
+    now = datetime.datetime.now()
+    leaves = ["a string", 1, 1.5, True, None, now, ("a", "tuple")]
+    for leaf in leaves:
+        assert copy_plain_data(leaf) is leaf
+
+    copied = copy_plain_data({"leaves": leaves})
+    for copied_leaf, leaf in zip(copied["leaves"], leaves):
+        assert copied_leaf is leaf
+
+
+def test_copy_plain_data_flattens_subclasses_to_plain_containers():
+    commented_map = CommentedMap()
+    commented_map["batches"] = CommentedSeq([OrderedDict([("a", 1)])])
+    copied = copy_plain_data(commented_map)
+    assert copied == {"batches": [{"a": 1}]}
+    assert type(copied) is dict
+    assert type(copied["batches"]) is list
+    assert type(copied["batches"][0]) is dict
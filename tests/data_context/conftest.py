@@ -1,5 +1,6 @@
 import os
 import shutil
+from unittest import mock
 
 import pytest
 
@@ -7,6 +8,28 @@ import great_expectations as ge
 from great_expectations.data_context.util import file_relative_path
 
 
+@pytest.fixture(scope="module")
+def empty_data_context_module_scoped(tmp_path_factory):
+    # The autouse no_usage_stats fixture is function scoped, so it has not run yet here
+    with mock.patch.dict(os.environ, {"GE_USAGE_STATS": "False"}):
+        project_path = str(tmp_path_factory.mktemp("empty_data_context"))
+        context = ge.data_context.DataContext.create(project_path)
+    context_path = os.path.join(project_path, "great_expectations")
+    asset_config_path = os.path.join(context_path, "expectations")
+    os.makedirs(asset_config_path, exist_ok=True)
+    return context
+
+
+@pytest.fixture
+def empty_data_context_without_checkpoints(empty_data_context_module_scoped):
+    """Share one empty DataContext across a module, removing any checkpoints a test writes."""
+    context = empty_data_context_module_scoped
+    yield context
+    for checkpoint_file in context._list_ymls_in_checkpoints_directory():
+        os.remove(checkpoint_file)
+    context._cached_checkpoints.clear()
+
+
 @pytest.fixture()
 def data_context_without_config_variables_filepath_configured(tmp_path_factory):
     # This data_context is *manually* created to have the config we want, vs created with DataContext.create
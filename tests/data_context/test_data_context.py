@@ -393,6 +393,44 @@ def test_data_context_get_datasource(titanic_data_context):
     isinstance(titanic_data_context.get_datasource("mydatasource"), LegacyDatasource)
 
 
+def test_create_expectation_suites(empty_data_context):
+    context = empty_data_context
+    suites = context.create_expectation_suites(["one", "two"])
+    assert [suite.expectation_suite_name for suite in suites] == ["one", "two"]
+    assert all(len(suite.expectations) == 0 for suite in suites)
+    assert sorted(context.list_expectation_suite_names()) == ["one", "two"]
+
+
+def test_create_expectation_suites_does_not_create_any_if_one_exists(
+    empty_data_context,
+):
+    context = empty_data_context
+    context.create_expectation_suite("two")
+    with pytest.raises(DataContextError):
+        context.create_expectation_suites(["one", "two", "three"])
+    assert context.list_expectation_suite_names() == ["two"]
+
+    for overwrite_existing in [False, True]:
+        with pytest.raises(DataContextError):
+            context.create_expectation_suites(
+                ["one", "one"], overwrite_existing=overwrite_existing
+            )
+    assert context.list_expectation_suite_names() == ["two"]
+
+    suites = context.create_expectation_suites(
+        ["one", "two", "three"], overwrite_existing=True
+    )
+    assert len(suites) == 3
+    assert sorted(context.list_expectation_suite_names()) == ["one", "three", "two"]
+
+
+def test_create_expectation_suites_raises_error_on_single_string(empty_data_context):
+    context = empty_data_context
+    with pytest.raises(ValueError):
+        context.create_expectation_suites("abc")
+    assert context.list_expectation_suite_names() == []
+
+
 def test_data_context_expectation_suite_delete(empty_data_context):
     assert empty_data_context.create_expectation_suite(
         expectation_suite_name="titanic.test_create_expectation_suite"
@@ -1529,8 +1567,10 @@ def test_list_validation_operators_data_context_with_one(titanic_data_context):
     ]
 
 
-def test_list_checkpoints_on_empty_context_returns_empty_list(empty_data_context):
-    assert empty_data_context.list_checkpoints() == []
+def test_list_checkpoints_on_empty_context_returns_empty_list(
+    empty_data_context_without_checkpoints,
+):
+    assert empty_data_context_without_checkpoints.list_checkpoints() == []
 
 
 def test_list_checkpoints_on_context_with_checkpoint(empty_context_with_checkpoint):
@@ -1567,6 +1607,12 @@ def test_list_checkpoints_on_context_with_checkpoint_and_other_files_in_checkpoi
     assert context.list_checkpoints() == ["my_checkpoint"]
 
 
+def test_has_checkpoint(empty_context_with_checkpoint):
+    context = empty_context_with_checkpoint
+    assert context.has_checkpoint("my_checkpoint")
+    assert not context.has_checkpoint("not_a_checkpoint")
+
+
 def test_get_checkpoint_raises_error_on_not_found_checkpoint(
     empty_context_with_checkpoint,
 ):
@@ -1617,9 +1663,11 @@ def test_get_checkpoint(empty_context_with_checkpoint):
     }
 
 
-def test_get_checkpoint_default_validation_operator(empty_data_context):
+def test_get_checkpoint_default_validation_operator(
+    empty_data_context_without_checkpoints,
+):
     yaml = YAML(typ="safe")
-    context = empty_data_context
+    context = empty_data_context_without_checkpoints
 
     checkpoint = {"batches": []}
     checkpoint_file_path = os.path.join(
@@ -1638,84 +1686,164 @@ def test_get_checkpoint_default_validation_operator(empty_data_context):
     assert expected == obs
 
 
-def test_get_checkpoint_raises_error_on_missing_batches_key(empty_data_context):
-    yaml = YAML(typ="safe")
-    context = empty_data_context
+def test_get_checkpoint_returns_isolated_copies(empty_context_with_checkpoint):
+    context = empty_context_with_checkpoint
+    first = context.get_checkpoint("my_checkpoint")
+    first["batches"][0]["expectation_suite_names"].append("mutated")
+    first["validation_operator_name"] = "mutated"
+
+    second = context.get_checkpoint("my_checkpoint")
+    assert second["validation_operator_name"] == "action_list_operator"
+    assert second["batches"][0]["expectation_suite_names"] == [
+        "suite_one",
+        "suite_two",
+    ]
 
-    checkpoint = {
-        "validation_operator_name": "action_list_operator",
-    }
+
+def test_get_checkpoint_reloads_after_file_changes(
+    empty_data_context_without_checkpoints,
+):
+    yaml = YAML(typ="safe")
+    context = empty_data_context_without_checkpoints
     checkpoint_file_path = os.path.join(
         context.root_directory, context.CHECKPOINTS_DIR, "foo.yml"
     )
     with open(checkpoint_file_path, "w") as f:
-        yaml.dump(checkpoint, f)
-    assert os.path.isfile(checkpoint_file_path)
+        yaml.dump({"batches": []}, f)
+    assert context.get_checkpoint("foo")["batches"] == []
 
-    with pytest.raises(CheckpointError) as e:
-        context.get_checkpoint("foo")
+    with open(checkpoint_file_path, "w") as f:
+        yaml.dump(
+            {
+                "validation_operator_name": "my_operator",
+                "batches": [
+                    {"batch_kwargs": {"foo": 33}, "expectation_suite_names": ["a"]}
+                ],
+            },
+            f,
+        )
+    obs = context.get_checkpoint("foo")
+    assert obs["validation_operator_name"] == "my_operator"
+    assert len(obs["batches"]) == 1
 
+    os.remove(checkpoint_file_path)
+    with pytest.raises(CheckpointNotFoundError):
+        context.get_checkpoint("foo")
+    assert "foo" not in context._cached_checkpoints
 
-def test_get_checkpoint_raises_error_on_non_list_batches(empty_data_context):
-    yaml = YAML(typ="safe")
-    context = empty_data_context
 
-    checkpoint = {
-        "validation_operator_name": "action_list_operator",
-        "batches": {"stuff": 33},
-    }
+def test_get_checkpoint_reloads_after_same_size_rewrite_with_same_mtime(
+    empty_data_context_without_checkpoints,
+):
+    context = empty_data_context_without_checkpoints
     checkpoint_file_path = os.path.join(
         context.root_directory, context.CHECKPOINTS_DIR, "foo.yml"
     )
     with open(checkpoint_file_path, "w") as f:
-        yaml.dump(checkpoint, f)
-    assert os.path.isfile(checkpoint_file_path)
+        f.write("validation_operator_name: operator_a\nbatches: []\n")
+    stat = os.stat(checkpoint_file_path)
+    assert context.get_checkpoint("foo")["validation_operator_name"] == "operator_a"
 
-    with pytest.raises(CheckpointError) as e:
-        context.get_checkpoint("foo")
+    # Simulate a filesystem with coarse timestamps: same size, same mtime
+    with open(checkpoint_file_path, "w") as f:
+        f.write("validation_operator_name: operator_b\nbatches: []\n")
+    os.utime(checkpoint_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(checkpoint_file_path).st_size == stat.st_size
 
+    assert context.get_checkpoint("foo")["validation_operator_name"] == "operator_b"
 
-def test_get_checkpoint_raises_error_on_missing_expectation_suite_names(
-    empty_data_context,
-):
-    yaml = YAML(typ="safe")
-    context = empty_data_context
 
+def test_add_checkpoint(empty_data_context_without_checkpoints):
+    context = empty_data_context_without_checkpoints
     checkpoint = {
-        "validation_operator_name": "action_list_operator",
         "batches": [
-            {
-                "batch_kwargs": {"foo": 33},
-            }
+            {"batch_kwargs": {"foo": 33}, "expectation_suite_names": ["my_suite"]}
         ],
     }
-    checkpoint_file_path = os.path.join(
+    checkpoint_file_path = context.add_checkpoint("foo", checkpoint)
+    assert checkpoint_file_path == os.path.join(
         context.root_directory, context.CHECKPOINTS_DIR, "foo.yml"
     )
-    with open(checkpoint_file_path, "w") as f:
-        yaml.dump(checkpoint, f)
     assert os.path.isfile(checkpoint_file_path)
+    assert context.list_checkpoints() == ["foo"]
+    assert context.get_checkpoint("foo") == {
+        "validation_operator_name": "action_list_operator",
+        "batches": [
+            {"batch_kwargs": {"foo": 33}, "expectation_suite_names": ["my_suite"]}
+        ],
+    }
 
-    with pytest.raises(CheckpointError) as e:
-        context.get_checkpoint("foo")
+
+def test_add_checkpoint_raises_error_on_invalid_checkpoint(
+    empty_data_context_without_checkpoints,
+):
+    context = empty_data_context_without_checkpoints
+    with pytest.raises(CheckpointError):
+        context.add_checkpoint("foo", {"validation_operator_name": "my_operator"})
+    assert context.list_checkpoints() == []
 
 
-def test_get_checkpoint_raises_error_on_missing_batch_kwargs(empty_data_context):
+def test_add_checkpoint_does_not_modify_the_given_checkpoint(
+    empty_data_context_without_checkpoints,
+):
+    context = empty_data_context_without_checkpoints
+    checkpoint = {"batches": []}
+    context.add_checkpoint("foo", checkpoint)
+    assert checkpoint == {"batches": []}
+
+
+def test_add_checkpoint_raises_error_on_existing_checkpoint(
+    empty_data_context_without_checkpoints,
+):
+    context = empty_data_context_without_checkpoints
+    context.add_checkpoint("foo", {"validation_operator_name": "a", "batches": []})
+    with pytest.raises(DataContextError):
+        context.add_checkpoint("foo", {"batches": []})
+    assert context.get_checkpoint("foo")["validation_operator_name"] == "a"
+
+    context.add_checkpoint(
+        "foo",
+        {"validation_operator_name": "b", "batches": []},
+        overwrite_existing=True,
+    )
+    assert context.get_checkpoint("foo")["validation_operator_name"] == "b"
+
+
+@pytest.mark.parametrize(
+    "bad_checkpoint",
+    [
+        {"validation_operator_name": "action_list_operator"},
+        {"validation_operator_name": "action_list_operator", "batches": {"stuff": 33}},
+        {
+            "validation_operator_name": "action_list_operator",
+            "batches": [{"batch_kwargs": {"foo": 33}}],
+        },
+        {
+            "validation_operator_name": "action_list_operator",
+            "batches": [{"expectation_suite_names": ["foo"]}],
+        },
+    ],
+    ids=[
+        "missing_batches_key",
+        "non_list_batches",
+        "missing_expectation_suite_names",
+        "missing_batch_kwargs",
+    ],
+)
+def test_get_checkpoint_raises_error_on_invalid_checkpoint(
+    empty_data_context_without_checkpoints, bad_checkpoint
+):
     yaml = YAML(typ="safe")
-    context = empty_data_context
+    context = empty_data_context_without_checkpoints
 
-    checkpoint = {
-        "validation_operator_name": "action_list_operator",
-        "batches": [{"expectation_suite_names": ["foo"]}],
-    }
     checkpoint_file_path = os.path.join(
         context.root_directory, context.CHECKPOINTS_DIR, "foo.yml"
     )
     with open(checkpoint_file_path, "w") as f:
-        yaml.dump(checkpoint, f)
+        yaml.dump(bad_checkpoint, f)
     assert os.path.isfile(checkpoint_file_path)
 
-    with pytest.raises(CheckpointError) as e:
+    with pytest.raises(CheckpointError):
         context.get_checkpoint("foo")
 
 
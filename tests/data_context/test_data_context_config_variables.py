@@ -339,6 +339,12 @@ See https://great-expectations.readthedocs.io/en/latest/reference/data_context_r
         substitute_config_variable(r"abc\${arg0}\$aRg3", config_variables_dict)
         == "abc${arg0}$aRg3"
     )
+    assert (
+        substitute_config_variable(
+            "abc@@aRg3", config_variables_dict, dollar_sign_escape_string="@@"
+        )
+        == "abc$aRg3"
+    )
 
     # Multiple configurations together
     assert (
@@ -1,9 +1,17 @@
+import inspect
+from unittest import mock
+
+import pytest
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
 from great_expectations.expectations.metrics import ColumnMax, ColumnValuesNonNull
+from great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema import (
+    ColumnValuesMatchJsonSchema,
+)
 from great_expectations.expectations.metrics.map_metric import ColumnMapMetricProvider
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -77,3 +85,25 @@ def test_get_map_metric_dependencies():
     metric = MetricConfiguration("foo.unexpected_index_list", dict(), dict())
     dependencies = mp.get_evaluation_dependencies(metric)
     assert dependencies["unexpected_condition"].id[0] == "foo.condition"
+
+
+def test_column_values_match_json_schema_spark_udf_survives_pickling():
+    # Spark ships UDFs to its executors with cloudpickle
+    cloudpickle = pytest.importorskip("cloudpickle")
+    json_schema = {
+        "type": "object",
+        "properties": {"a": {"type": "integer"}},
+        "required": ["a"],
+    }
+    module = "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema"
+    with mock.patch(f"{module}.F") as mock_F, mock.patch(f"{module}.sparktypes"):
+        inspect.unwrap(ColumnValuesMatchJsonSchema._spark)(
+            ColumnValuesMatchJsonSchema, "my_column", json_schema
+        )
+    matches_json_schema = mock_F.udf.call_args[0][0]
+
+    unpickled = cloudpickle.loads(cloudpickle.dumps(matches_json_schema))
+    assert unpickled('{"a": 1}') is True
+    assert unpickled('{"a": "one"}') is False
+    assert unpickled('{"b": 1}') is False
+    assert unpickled(None) is False
@@ -1,3 +1,5 @@
+import copy
+
 import jsonschema
 import pytest
 
@@ -6,7 +8,7 @@ from great_expectations.profile.base import ProfilerTypeMapping
 from great_expectations.profile.json_schema_profiler import JsonSchemaProfiler
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_schema():
     return {
         "$id": "https://example.com/address.schema.json",
@@ -19,7 +21,7 @@ def simple_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def complex_flat_schema():
     """This includes some descriptions."""
     return {
@@ -43,7 +45,7 @@ def complex_flat_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def boolean_types_schema():
     return {
         "$id": "https://example.com/address.schema.json",
@@ -65,7 +67,7 @@ def boolean_types_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def enum_types_schema():
     return {
         "$id": "https://example.com/address.schema.json",
@@ -92,7 +94,7 @@ def enum_types_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def string_lengths_schema():
     """
     This fixture has various combinations string lengths.
@@ -127,7 +129,7 @@ def string_lengths_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def integer_ranges_schema():
     """
     This fixture has various combinations of integer ranges.
@@ -166,7 +168,7 @@ def integer_ranges_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def number_ranges_schema():
     """
     This fixture has various combinations of number ranges.
@@ -205,7 +207,7 @@ def number_ranges_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def null_fields_schema():
     """
     This fixture has null fields.
@@ -273,10 +275,11 @@ def test_profile_raises_error_on_schema_with_top_level_type_other_than_object():
 
 def test_profile_enum_with_bad_input_raises_schema_error(enum_types_schema):
     profiler = JsonSchemaProfiler()
-    # mangle the enum list
-    enum_types_schema["properties"]["shirt-size"]["enum"] = "foo"
+    # mangle the enum list of a copy, since the fixture is shared across the module
+    bad_schema = copy.deepcopy(enum_types_schema)
+    bad_schema["properties"]["shirt-size"]["enum"] = "foo"
     with pytest.raises(jsonschema.SchemaError):
-        profiler.profile(enum_types_schema, "enums")
+        profiler.profile(bad_schema, "enums")
 
 
 def test_profile_simple_schema(empty_data_context, simple_schema):